@@ -10,6 +10,21 @@ to visually identify UIView objects with ambiguous Auto Layout constraints.
 
 import lldbbase as bc
 
+# Objective-C expression templates used by the view traversal. Defined once
+# at module scope so each visited view only substitutes its address.
+_KEY_WINDOW_EXPR = "(id)[[UIApplication sharedApplication] keyWindow]"
+_IS_UIVIEW_EXPR = "[(id){view} isKindOfClass:[UIView class]]"
+_HAS_AMBIGUOUS_EXPR = "(BOOL)[{view} hasAmbiguousLayout]"
+_SUBVIEWS_EXPR = "(id)[{view} subviews]"
+_SUBVIEWS_COUNT_EXPR = "(int)[(id){subviews} count]"
+_SUBVIEW_AT_INDEX_EXPR = "(id)[{subviews} objectAtIndex:{index}]"
+_IS_CALAYER_EXPR = "[(id){view} isKindOfClass:(Class)[CALayer class]]"
+_RESPONDS_TO_LAYER_EXPR = "[(id){view} respondsToSelector:(SEL)@selector(layer)]"
+_LAYER_EXPR = "(CALayer *)[{view} layer]"
+_COLOR_EXPR = "(id)[UIColor {color}Color]"
+_SET_BORDER_WIDTH_EXPR = "[{layer} setBorderWidth:(CGFloat){width}]"
+_SET_BORDER_COLOR_EXPR = "[{layer} setBorderColor:(CGColorRef)[(id){color} CGColor]]"
+
 
 def commands():
     """Returns a list of custom LLDB command instances defined in this module."""
@@ -64,12 +79,20 @@ class DTAutoLayoutCheckCommand(bc.BaseCommand):
         """
 
         # Get the current key window of the application
-        key_window = bc.evaluate_expression(
-            "(id)[[UIApplication sharedApplication] keyWindow]"
-        )
+        key_window = bc.evaluate_expression(_KEY_WINDOW_EXPR)
+
+        # Without a key window there is nothing to traverse — bail out
+        # before paying for any per-view expression round-trips.
+        if key_window is None or int(key_window, 16) == 0:
+            print("error: could not get the application key window")
+            return
+
+        # The border color never changes during the traversal, so resolve
+        # the UIColor object once instead of re-evaluating it per view.
+        color = bc.evaluate_expression(_COLOR_EXPR.format(color=options.color))
 
         # Start the recursive highlighting process
-        set_border_on_ambiguous(key_window, options.color, options.width)
+        set_border_on_ambiguous(key_window, color, options.width)
 
 
 def set_border_on_ambiguous(view, color, width):
@@ -78,26 +101,30 @@ def set_border_on_ambiguous(view, color, width):
     and draws a border with the given color and width if they do.
 
     :param view: Name of the UIView variable in LLDB (as a string address)
-    :param color: UIColor name as a string (e.g., "red", "blue")
+    :param color: Resolved UIColor object (as a string address)
     :param width: Border width (float)
     """
 
     # Check if the object is actually a UIView
-    if not bc.evaluate_bool_expression(f"[(id){view} isKindOfClass:[UIView class]]"):
+    if not bc.evaluate_bool_expression(_IS_UIVIEW_EXPR.format(view=view)):
         return
 
     # Check if this specific view has an ambiguous layout
-    if bc.evaluate_bool_expression(f"(BOOL)[{view} hasAmbiguousLayout]"):
+    if bc.evaluate_bool_expression(_HAS_AMBIGUOUS_EXPR.format(view=view)):
         draw_border(view, color, width)
 
     # Get the list of subviews
-    subviews = bc.evaluate_expression(f"(id)[{view} subviews]")
-    subviews_count = int(bc.evaluate_expression(f"(int)[(id){subviews} count]"))
+    subviews = bc.evaluate_expression(_SUBVIEWS_EXPR.format(view=view))
+    subviews_count = int(
+        bc.evaluate_expression(_SUBVIEWS_COUNT_EXPR.format(subviews=subviews))
+    )
 
     # Recursively check each subview
     if subviews_count > 0:
         for i in range(subviews_count):
-            subview = bc.evaluate_expression(f"(id)[{subviews} objectAtIndex:{i}]")
+            subview = bc.evaluate_expression(
+                _SUBVIEW_AT_INDEX_EXPR.format(subviews=subviews, index=i)
+            )
             set_border_on_ambiguous(subview, color, width)
 
 
@@ -111,15 +138,11 @@ def retrieve_layer(view):
     """
 
     # If it's already a CALayer, return it as is
-    if bc.evaluate_bool_expression(
-        f"[(id){view} isKindOfClass:(Class)[CALayer class]]"
-    ):
+    if bc.evaluate_bool_expression(_IS_CALAYER_EXPR.format(view=view)):
         return view
     # If it has a layer property, retrieve it
-    elif bc.evaluate_bool_expression(
-        f"[(id){view} respondsToSelector:(SEL)@selector(layer)]"
-    ):
-        return bc.evaluate_expression(f"(CALayer *)[{view} layer]")
+    elif bc.evaluate_bool_expression(_RESPONDS_TO_LAYER_EXPR.format(view=view)):
+        return bc.evaluate_expression(_LAYER_EXPR.format(view=view))
     else:
         raise Exception("Argument must be a CALayer, UIView, or NSView.")
 
@@ -129,16 +152,14 @@ def draw_border(view, color, width):
     Sets a border on the given view or layer with the specified color and width.
 
     :param view: Name of the view or layer variable in LLDB (string address)
-    :param color: UIColor name (e.g., "red", "blue")
+    :param color: Resolved UIColor object (string address)
     :param width: Border width (float)
     """
 
     layer = retrieve_layer(view)
 
     # Set the border width on the CALayer
-    bc.evaluate_effect(f"[{layer} setBorderWidth:(CGFloat){width}]")
+    bc.evaluate_effect(_SET_BORDER_WIDTH_EXPR.format(layer=layer, width=width))
 
     # Set the border color on the CALayer using the requested UIColor
-    bc.evaluate_effect(
-        f"[{layer} setBorderColor:(CGColorRef)[(id)[UIColor {color}Color] CGColor]]"
-    )
+    bc.evaluate_effect(_SET_BORDER_COLOR_EXPR.format(layer=layer, color=color))
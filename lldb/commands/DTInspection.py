@@ -11,6 +11,17 @@ for reading memory at a specific address and displaying it in a formatted hex du
 import lldbbase as bc
 import lldb
 
+# Static output framing, built once at import time instead of per command run.
+_HEX_DUMP_HEADER = (
+    "\nAddress            00 01 02 03 04 05 06 07  08 09 0A 0B 0C 0D 0E 0F  ASCII"
+)
+_HEX_DUMP_RULER = "-" * 80
+_FRAME_BANNER = "=" * 80
+
+# Maps every byte to its printable character, or '.' for non-printables,
+# so the ASCII column is a single bytes.translate call per row.
+_ASCII_TABLE = bytes(b if 32 <= b <= 126 else ord(".") for b in range(256))
+
 
 def commands():
     """
@@ -135,10 +146,7 @@ class DTHexDumpCommand(bc.BaseCommand):
             )
             return
 
-        print(
-            "\nAddress            00 01 02 03 04 05 06 07  08 09 0A 0B 0C 0D 0E 0F  ASCII"
-        )
-        print("-" * 80)
+        lines = [_HEX_DUMP_HEADER, _HEX_DUMP_RULER]
 
         for i in range(0, len(bytes_data), 16):
             chunk = bytes_data[i : i + 16]
@@ -153,21 +161,12 @@ class DTHexDumpCommand(bc.BaseCommand):
 
             hex_part = hex_part.ljust(48)
 
-            ascii_chars = []
-
-            for b in chunk:
-                byte_val = b if isinstance(b, int) else ord(b)
+            ascii_part = chunk.translate(_ASCII_TABLE).decode("ascii")
 
-                if 32 <= byte_val <= 126:
-                    ascii_chars.append(chr(byte_val))
-                else:
-                    ascii_chars.append(".")
+            lines.append(f"0x{current_addr:016x}  {hex_part}  {ascii_part}")
 
-            ascii_part = "".join(ascii_chars)
-
-            print(f"0x{current_addr:016x}  {hex_part}  {ascii_part}")
-
-        print("")
+        lines.append("")
+        print("\n".join(lines))
 
 
 class DTPrintFrameCommand(bc.BaseCommand):
@@ -234,18 +233,20 @@ class DTPrintFrameCommand(bc.BaseCommand):
 
         function_name = "Unknown Function"
 
-        if symbol_context.GetFunction().IsValid():
-            function_name = symbol_context.GetFunction().GetName()
-        elif symbol_context.GetSymbol().IsValid():
-            function_name = symbol_context.GetSymbol().GetName()
+        function = symbol_context.GetFunction()
+        symbol = symbol_context.GetSymbol()
+
+        if function.IsValid():
+            function_name = function.GetName()
+        elif symbol.IsValid():
+            function_name = symbol.GetName()
 
         aslr_offset_str = "N/A"
 
         if module and module.IsValid():
-            header_load_addr = module.GetObjectFileHeaderAddress().GetLoadAddress(
-                target
-            )
-            header_file_addr = module.GetObjectFileHeaderAddress().GetFileAddress()
+            header_address = module.GetObjectFileHeaderAddress()
+            header_load_addr = header_address.GetLoadAddress(target)
+            header_file_addr = header_address.GetFileAddress()
 
             if header_load_addr != lldb.LLDB_INVALID_ADDRESS:
                 aslr_slide = header_load_addr - header_file_addr
@@ -254,9 +255,9 @@ class DTPrintFrameCommand(bc.BaseCommand):
                     f"0x{relative_offset:x} (Module ASLR Slide: 0x{aslr_slide:x})"
                 )
 
-        print("\n" + "=" * 80)
+        print("\n" + _FRAME_BANNER)
         print(f"[FRAME #{frame_idx}] -> CURRENT CPU ARCHITECTURE CONTEXT")
-        print("=" * 80)
+        print(_FRAME_BANNER)
         print(f"• Module:      {module_name}")
         print(f"• Function:    {function_name}")
         print(f"• Address PC:  0x{pc_address:016x}")
@@ -269,6 +270,6 @@ class DTPrintFrameCommand(bc.BaseCommand):
                 f"• Source File: {line_entry.GetFileSpec().GetFilename()}:{line_entry.GetLine()}"
             )
 
-        print("=" * 80 + "\n")
+        print(_FRAME_BANNER + "\n")
 
         return
@@ -10,6 +10,33 @@ to dump the contents of NSUserDefaults as a formatted table.
 
 import lldbbase as bc
 
+# Objective-C expression templates used while dumping defaults. Defined
+# once at module scope so each entry only substitutes object addresses.
+_STANDARD_DEFAULTS_EXPR = "(id)[NSUserDefaults standardUserDefaults]"
+_SUITE_DEFAULTS_EXPR = '(id)[[NSUserDefaults alloc] initWithSuiteName:@"{suite}"]'
+_DICT_REPRESENTATION_EXPR = (
+    "(id)[(NSUserDefaults *){defaults} dictionaryRepresentation]"
+)
+_ALL_KEYS_EXPR = "(id)[(NSDictionary *){dictionary} allKeys]"
+_KEYS_COUNT_EXPR = "[(NSArray *){keys} count]"
+_KEY_AT_INDEX_EXPR = "(id)[(NSArray *){keys} objectAtIndex:{index}]"
+_UTF8_STRING_EXPR = "(const char *)[(NSString *){obj} UTF8String]"
+_VALUE_FOR_KEY_EXPR = "(id)[(NSDictionary *){dictionary} objectForKey:{key}]"
+_CLASS_NAME_EXPR = "(const char *)object_getClassName((id){obj})"
+_DESCRIPTION_EXPR = "(id)[(NSObject *){obj} description]"
+
+# Common Objective-C cluster classes mapped to short display names.
+# Built once at import time so shorten_class_name is a single dict lookup.
+_SHORT_CLASS_NAMES = {
+    "__NSCFBoolean": "Bool",
+    "__NSCFString": "String",
+    "__NSCFNumber": "Number",
+    "__NSCFArray": "Array",
+    "__NSCFDictionary": "Dictionary",
+    "__NSTaggedDate": "Date",
+    "NSConcreteMutableData": "Data",
+}
+
 
 def commands():
     """Returns a list of custom LLDB command instances defined in this module."""
@@ -97,10 +124,8 @@ def get_defaults_instance(suite):
     """
 
     if suite:
-        return bc.evaluate_expression(
-            f'(id)[[NSUserDefaults alloc] initWithSuiteName:@"{suite}"]'
-        )
-    return bc.evaluate_expression("(id)[NSUserDefaults standardUserDefaults]")
+        return bc.evaluate_expression(_SUITE_DEFAULTS_EXPR.format(suite=suite))
+    return bc.evaluate_expression(_STANDARD_DEFAULTS_EXPR)
 
 
 def get_dictionary_representation(defaults):
@@ -112,9 +137,7 @@ def get_dictionary_representation(defaults):
     :return: NSDictionary address string
     """
 
-    return bc.evaluate_expression(
-        f"(id)[(NSUserDefaults *){defaults} dictionaryRepresentation]"
-    )
+    return bc.evaluate_expression(_DICT_REPRESENTATION_EXPR.format(defaults=defaults))
 
 
 def collect_entries(defaults, filter_str):
@@ -129,20 +152,26 @@ def collect_entries(defaults, filter_str):
 
     dictionary = get_dictionary_representation(defaults)
 
-    keys = bc.evaluate_expression(f"(id)[(NSDictionary *){dictionary} allKeys]")
-    count = bc.evaluate_integer_expression(f"[(NSArray *){keys} count]")
+    keys = bc.evaluate_expression(_ALL_KEYS_EXPR.format(dictionary=dictionary))
+    count = bc.evaluate_integer_expression(_KEYS_COUNT_EXPR.format(keys=keys))
 
     entries = []
+    needle = filter_str.lower()
 
     for i in range(count):
-        key_obj = bc.evaluate_expression(f"(id)[(NSArray *){keys} objectAtIndex:{i}]")
-        key_str = nsstring_to_str(key_obj)
+        key_expr = _KEY_AT_INDEX_EXPR.format(keys=keys, index=i)
 
-        if filter_str and filter_str.lower() not in key_str.lower():
+        # Read the key text in one expression instead of fetching the
+        # NSString object first and converting it in a second round-trip.
+        key_value = bc.evaluate_expression_value(_UTF8_STRING_EXPR.format(obj=key_expr))
+        summary = key_value.GetSummary()
+        key_str = summary.strip('"') if summary else "<unreadable>"
+
+        if needle and needle not in key_str.lower():
             continue
 
         val_obj = bc.evaluate_expression(
-            f"(id)[(NSDictionary *){dictionary} objectForKey:(id){key_obj}]"
+            _VALUE_FOR_KEY_EXPR.format(dictionary=dictionary, key=key_expr)
         )
 
         val_str = format_value(val_obj)
@@ -163,9 +192,7 @@ def nsstring_to_str(obj):
     if obj is None or obj == "0x0":
         return "<nil>"
 
-    value = bc.evaluate_expression_value(
-        f"(const char *)[(NSString *){obj} UTF8String]"
-    )
+    value = bc.evaluate_expression_value(_UTF8_STRING_EXPR.format(obj=obj))
 
     summary = value.GetSummary()
 
@@ -181,9 +208,7 @@ def get_class_name(obj):
     :param obj: Object address string (e.g. '0x600003a12340')
     :return: Class name string, or '<unknown>' on failure
     """
-    value = bc.evaluate_expression_value(
-        f"(const char *)object_getClassName((id){obj})"
-    )
+    value = bc.evaluate_expression_value(_CLASS_NAME_EXPR.format(obj=obj))
     summary = value.GetSummary()
     if summary:
         return summary.strip('"')
@@ -203,7 +228,7 @@ def format_value(obj):
 
     class_name = get_class_name(obj)
     description = nsstring_to_str(
-        bc.evaluate_expression(f"(id)[(NSObject *){obj} description]")
+        bc.evaluate_expression(_DESCRIPTION_EXPR.format(obj=obj))
     )
 
     short = shorten_class_name(class_name)
@@ -219,17 +244,7 @@ def shorten_class_name(class_name):
     :return: Shortened display name
     """
 
-    replacements = {
-        "__NSCFBoolean": "Bool",
-        "__NSCFString": "String",
-        "__NSCFNumber": "Number",
-        "__NSCFArray": "Array",
-        "__NSCFDictionary": "Dictionary",
-        "__NSTaggedDate": "Date",
-        "NSConcreteMutableData": "Data",
-    }
-
-    return replacements.get(class_name, class_name)
+    return _SHORT_CLASS_NAMES.get(class_name, class_name)
 
 
 def is_tagged_pointer(obj):
@@ -261,19 +276,24 @@ def print_table(entries, label, filter_str):
     max_key_len = min(max(len(k) for k, _ in entries), 50)
     sep = "─" * (max_key_len + 2) + "┼" + "─" * 46
 
-    print(f"\n  NSUserDefaults: {label}")
-    print(f"  {sep}")
-    print(f"  {'KEY':<{max_key_len}}  │  VALUE")
-    print(f"  {sep}")
+    lines = [
+        f"\n  NSUserDefaults: {label}",
+        f"  {sep}",
+        f"  {'KEY':<{max_key_len}}  │  VALUE",
+        f"  {sep}",
+    ]
 
     for key, value in entries:
         display_key = key[:max_key_len]
         display_val = value[:80] + ("…" if len(value) > 80 else "")
-        print(f"  {display_key:<{max_key_len}}  │  {display_val}")
+        lines.append(f"  {display_key:<{max_key_len}}  │  {display_val}")
+
+    lines.append(f"  {sep}")
 
-    print(f"  {sep}")
     footer = f"  {len(entries)} keys"
     if filter_str:
         footer += f"  (filter: '{filter_str}')"
-    print(footer)
-    print()
+
+    lines.append(footer)
+    lines.append("")
+    print("\n".join(lines))
@@ -95,6 +95,29 @@ class CommandArgument:
         self.boolean = boolean  # True if the option is a toggle (no value)
 
 
+# SBExpressionOptions are pure configuration, so one instance per language
+# is built lazily and reused across evaluations.
+_expression_options = {}
+
+
+def _options_for_language(language):
+    """
+    Returns a cached lldb.SBExpressionOptions configured for the given
+    language, creating it on first use.
+
+    :param language: The language context for evaluation.
+    :return: An lldb.SBExpressionOptions object.
+    """
+    options = _expression_options.get(language)
+    if options is None:
+        options = lldb.SBExpressionOptions()
+        options.SetTrapExceptions(False)
+        options.SetLanguage(language)
+        _expression_options[language] = options
+
+    return options
+
+
 def evaluate_expression_value(expression, language=lldb.eLanguageTypeObjC_plus_plus):
     """
     Evaluates an expression in the current LLDB debugging frame
@@ -111,9 +134,7 @@ def evaluate_expression_value(expression, language=lldb.eLanguageTypeObjC_plus_p
         .GetSelectedFrame()
     )
 
-    options = lldb.SBExpressionOptions()
-    options.SetTrapExceptions(False)
-    options.SetLanguage(language)
+    options = _options_for_language(language)
 
     value = frame.EvaluateExpression(expression, options)
 
@@ -133,27 +154,7 @@ def evaluate_expression(expression, language=lldb.eLanguageTypeObjC_plus_plus):
     :param language: The language context (default: ObjC++).
     :return: The string value of the expression result.
     """
-    if expression.startswith("(id)"):
-        return evaluate_expression_value(expression, language).GetValue()
-
-    frame = (
-        lldb.debugger.GetSelectedTarget()
-        .GetProcess()
-        .GetSelectedThread()
-        .GetSelectedFrame()
-    )
-
-    options = lldb.SBExpressionOptions()
-    options.SetTrapExceptions(False)
-    options.SetLanguage(language)
-
-    value = frame.EvaluateExpression(expression, options)
-
-    error = value.GetError()
-    if error.Fail():
-        print(f"Error evaluating '{expression}': {error}")
-
-    return value.GetValue()
+    return evaluate_expression_value(expression, language).GetValue()
 
 
 def evaluate_effect(expression):
@@ -164,7 +165,7 @@ def evaluate_effect(expression):
     :param expression: The expression to execute.
     :return: The result of the evaluation (usually None/void).
     """
-    return evaluate_expression("(void)(" + expression + ")")
+    return evaluate_expression(f"(void)({expression})")
 
 
 def evaluate_integer_expression(expression):
@@ -175,7 +176,7 @@ def evaluate_integer_expression(expression):
     :param expression: The expression resulting in an integer.
     :return: An integer value.
     """
-    output = evaluate_expression("(int)(" + expression + ")").replace("'", "")
+    output = evaluate_expression(f"(int)({expression})").replace("'", "")
     if output.startswith("\\x"):
         output = output[2:]
     elif output.startswith("\\"):
@@ -195,4 +196,4 @@ def evaluate_bool_expression(expression):
     :param expression: The expression resulting in a BOOL.
     :return: True or False.
     """
-    return int(evaluate_integer_expression("(BOOL)(" + expression + ")")) != 0
+    return int(evaluate_integer_expression(f"(BOOL)({expression})")) != 0
@@ -42,11 +42,11 @@ def load_settings(dir_path: str):
     This allows you to define LLDB aliases, settings, and custom behavior
     in plain text files that are sourced on load using 'command source'.
     """
-    for file in os.listdir(dir_path):
-        if file.endswith(".txt"):
-            full_path = os.path.join(dir_path, file)
-            # -e0: don't stop on error, -s1: silent mode
-            lldb.debugger.HandleCommand(f'command source -e0 -s1 "{full_path}"')
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".txt"):
+                # -e0: don't stop on error, -s1: silent mode
+                lldb.debugger.HandleCommand(f'command source -e0 -s1 "{entry.path}"')
 
 
 def load_commands_from(commands_dir: str):
@@ -57,13 +57,20 @@ def load_commands_from(commands_dir: str):
     defines a `commands()` function, its return values (command instances)
     are registered with LLDB.
     """
-    if not os.path.exists(commands_dir):
+    # Opening the directory directly avoids a separate existence check
+    # (one stat syscall) and the race between the check and the scan.
+    try:
+        entries = os.scandir(commands_dir)
+    except FileNotFoundError:
         return
 
-    for file in os.listdir(commands_dir):
-        if file.endswith(".py"):
-            path = os.path.join(commands_dir, file)
-            module_name = f"lldb_command_{file[:-3]}"
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".py"):
+                continue
+
+            path = entry.path
+            module_name = f"lldb_command_{entry.name[:-3]}"
 
             # Dynamic module loading
             spec = importlib.util.spec_from_file_location(module_name, path)
@@ -86,8 +93,17 @@ def register_command(command, module_name, file_path):
     - Redirects stdout/stderr to LLDB's result object.
     - Registers the command via `command script add`.
     """
-    key = f"{file_path}_{command.name()}"
-    function_name = f"__{command.name().replace('-', '_')}"
+    name = command.name()
+    key = f"{file_path}_{name}"
+    function_name = f"__{name.replace('-', '_')}"
+
+    # The parser depends only on the command's declared options, so build it
+    # once at registration time instead of on every invocation. The same
+    # goes for the declared argument count — args() and options() build
+    # fresh CommandArgument lists on every call.
+    parser = generate_option_parser(command)
+    has_options = bool(command.options())
+    expected_arg_count = len(command.args())
 
     def run_command(debugger, input_str, exe_ctx, result, _):
         """Wrapper function that LLDB actually calls."""
@@ -100,13 +116,10 @@ def register_command(command, module_name, file_path):
             split_input = command.lex(input_str)
 
             # Ensure parser doesn't get confused by missing '--'
-            options = command.options()
-            if len(options) == 0:
-                if "--" not in split_input:
-                    split_input.insert(0, "--")
+            if not has_options and "--" not in split_input:
+                split_input.insert(0, "--")
 
             # Parse arguments and options
-            parser = generate_option_parser(command)
             try:
                 (options, args) = parser.parse_args(split_input)
             except Exception:
@@ -114,8 +127,8 @@ def register_command(command, module_name, file_path):
                 return
 
             # Handle positional argument gathering (if more than expected)
-            if len(args) > len(command.args()):
-                overhead = len(args) - len(command.args())
+            if len(args) > expected_arg_count:
+                overhead = len(args) - expected_arg_count
                 head = args[: overhead + 1]
                 args = [" ".join(head)] + args[-overhead:]
 
@@ -127,12 +140,8 @@ def register_command(command, module_name, file_path):
     run_command.__doc__ = help_for_command(command)
 
     # Store the function in the module so it's not garbage collected
-    # pylint: disable=protected-access
-    if not hasattr(sys.modules[module_name], "_loadedFunctions"):
-        sys.modules[module_name]._loadedFunctions = {}
-
-    sys.modules[module_name]._loadedFunctions[key] = run_command
-    # pylint: enable=protected-access
+    loaded = vars(sys.modules[module_name]).setdefault("_loadedFunctions", {})
+    loaded[key] = run_command
 
     # Create a global reference in Python script environment
     lldb.debugger.HandleCommand(
@@ -140,9 +149,7 @@ def register_command(command, module_name, file_path):
     )
 
     # Add the command to LLDB
-    lldb.debugger.HandleCommand(
-        f"command script add --function {function_name} {command.name()}"
-    )
+    lldb.debugger.HandleCommand(f"command script add --function {function_name} {name}")
 
 
 def help_for_command(command) -> str:
@@ -186,15 +193,17 @@ def validate_args(args, command):
     Validates the arguments provided to a command.
     Ensures required arguments are present and fills in defaults for optional ones.
     """
-    if len(args) < len(command.args()):
-        default_args = [arg.default for arg in command.args()]
+    arg_specs = command.args()
+
+    if len(args) < len(arg_specs):
+        default_args = [arg.default for arg in arg_specs]
         default_args_to_append = default_args[len(args) :]
 
         index = len(args)
 
         for default_arg in default_args_to_append:
             if not default_arg:
-                arg = command.args()[index]
+                arg = arg_specs[index]
                 print(f"Whoops! You are missing the <{arg.argName}> argument.")
                 print(f"\nUsage: {usage_for_command(command)}")
                 return
@@ -209,11 +218,11 @@ def usage_for_command(command):
     """
     Generates a usage string for a command based on its arguments.
     """
-    usage = command.name()
+    parts = [command.name()]
     for arg in command.args():
         if arg.default:
-            usage += f" [{arg.argName}]"
+            parts.append(f"[{arg.argName}]")
         else:
-            usage += f" {arg.argName}"
+            parts.append(arg.argName)
 
-    return usage
+    return " ".join(parts)